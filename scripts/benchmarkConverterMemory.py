@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Peak-memory benchmark for the Excel -> JSON converters
+
+Compares, with tracemalloc on synthetic events:
+  - the record/sort/write stage: the old list-of-dicts + json.dump approach vs
+    the converter's Event namedtuples + jsonStream.write_records_json()
+  - convert_excel_to_json() end to end on a generated workbook
+
+Needs openpyxl.
+
+Usage:
+  python3 benchmarkConverterMemory.py 100000
+"""
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from convertExcelToJson import Event, convert_excel_to_json, event_to_dict
+from jsonStream import sorted_order, write_records_json
+
+EVENT_HEADERS = ['event_title', 'date', 'time', 'venue', 'type', 'description',
+                 'collaborators', 'catering', 'signup_link']
+
+
+def _synthetic_rows(n, seed=0):
+    """Rows in events_template.xlsx column order."""
+    rng = random.Random(seed)
+    words = ['data', 'python', 'workshop', 'social', 'industry', 'night', 'panel', 'careers', 'intro', 'ml']
+    for i in range(n):
+        yield (
+            f'{rng.choice(words).title()} {rng.choice(words)} #{i}',
+            f'{rng.randint(2020, 2027)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+            f'{rng.randint(9, 20):02d}:{rng.choice(("00", "30"))}',
+            f'Room {rng.randint(100, 999)}',
+            rng.choice(('academic', 'social', 'industry')),
+            ' '.join(rng.choices(words, k=30)),
+            ', '.join(['SUDATA'] + rng.sample(['SUCS', 'SULS', 'SUMS', 'SYNCS', 'SUBS'], rng.randint(0, 2))),
+            'Pizza',
+            f'https://forms.gle/{i}',
+        )
+
+
+def _to_event_values(row):
+    """Row -> values in the converter's Event field order (minus attendees)."""
+    title, date, time_, venue, event_type, description, collaborators, catering, link = row
+    return (title, date, time_, venue, event_type, description,
+            [c.strip() for c in collaborators.split(',')], catering, link)
+
+
+def _dict_pipeline(rows, path):
+    """The previous converter approach: list of dicts, sort, mutate ids, json.dump."""
+    events = []
+    for row in rows:
+        events.append(dict(zip(Event._fields, _to_event_values(row) + (0,))))
+    events.sort(key=lambda x: (x['date'], x['time']))
+    for idx, event in enumerate(events, 1):
+        event['id'] = f"event_{str(idx).zfill(3)}"
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'events': events}, f, indent=2, ensure_ascii=False)
+
+
+def _compact_pipeline(rows, path):
+    """The current converter approach, using the converter's Event and event_to_dict."""
+    events = []
+    keys = []
+    for row in rows:
+        event = Event(*_to_event_values(row), 0)
+        events.append(event)
+        keys.append((event.date, event.time))
+    order = sorted_order(keys)
+    del keys
+    write_records_json(path, 'events', (events[i] for i in order), event_to_dict)
+
+
+def _write_workbook(path, n_records):
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Events 2025')
+    ws.append(EVENT_HEADERS)
+    for row in _synthetic_rows(n_records):
+        ws.append(row)
+    wb.save(path)
+
+
+def _measure(label, func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        func(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'   {label:<34} peak {peak / 1024 / 1024:7.1f} MB   {elapsed:6.2f}s')
+
+
+def run_benchmark(n_records):
+    """
+    Measure peak memory (tracemalloc) of:
+      - the record/sort/write stage, old list-of-dicts approach vs the converter's
+      - convert_excel_to_json() end to end on a generated workbook
+    """
+    print(f'🧪 {n_records} synthetic events')
+    with tempfile.TemporaryDirectory() as tmp:
+        outputs = []
+        for label, pipeline in (('stage: dicts + json.dump', _dict_pipeline),
+                                ('stage: namedtuples + stream', _compact_pipeline)):
+            path = os.path.join(tmp, f'{pipeline.__name__}.json')
+            _measure(label, pipeline, _synthetic_rows(n_records), path)
+            with open(path, 'rb') as f:
+                outputs.append(f.read())
+        data_mb = len(outputs[0]) / 1024 / 1024
+        print(f'   {"output size":<34}      {data_mb:7.1f} MB')
+        print('   ✅ Stage outputs identical' if outputs[0] == outputs[1] else '   ❌ Stage outputs differ')
+        del outputs
+
+        xlsx_path = os.path.join(tmp, 'events.xlsx')
+        print('📝 Writing synthetic workbook...')
+        _write_workbook(xlsx_path, n_records)
+        _measure('convert_excel_to_json (end to end)', convert_excel_to_json,
+                 xlsx_path, os.path.join(tmp, 'events.json'))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or not sys.argv[1].isdigit():
+        print('\n📘 Usage: python3 benchmarkConverterMemory.py <number-of-events>')
+        print('\n📝 Example:')
+        print('  python3 benchmarkConverterMemory.py 100000\n')
+        sys.exit(1)
+
+    run_benchmark(int(sys.argv[1]))
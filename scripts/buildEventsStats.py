@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Build pre-aggregated event statistics (events_stats.json) from events.json
+Run after convertExcelToJson.py.
+
+Rollups:
+  totals             number of events and total attendees
+  byType             events/attendees per type (academic, social, industry)
+  byYear             events/attendees per year, with a per-type breakdown
+  byMonth            events per month ("YYYY-MM")
+  topCollaborators   societies SUDATA ran the most events with
+  venues             events per venue (TBA excluded)
+
+Incremental builds: events are grouped by the year of their date, and each
+year's partial rollup is cached in .events_stats_cache.json next to the output
+with a fingerprint of that year's events. When only one year's sheet changed,
+only that year is re-aggregated; the rest are merged from the cache. The
+merge always runs, and the output is only rewritten when it would change.
+
+Usage:
+  python3 buildEventsStats.py src/data/events.json src/data/events_stats.json
+"""
+import hashlib
+import json
+import os
+import sys
+from collections import Counter
+
+STATS_VERSION = 1
+CACHE_NAME = '.events_stats_cache.json'
+TOP_COLLABORATORS = 10
+HOST_SOCIETY = 'SUDATA'  # on every event, so left out of topCollaborators
+
+
+def event_year(event):
+    date = event.get('date') or ''
+    return date[:4] if len(date) >= 4 and date[:4].isdigit() else 'TBA'
+
+
+def group_by_year(events):
+    years = {}
+    for event in events:
+        years.setdefault(event_year(event), []).append(event)
+    return years
+
+
+def fingerprint(events):
+    """Hash of the fields the rollups read, so unrelated edits don't force a rebuild."""
+    fields = [(e.get('date'), e.get('type'), e.get('venue'), e.get('collaborators'), e.get('attendees'))
+              for e in events]
+    return hashlib.sha1(json.dumps(fields).encode('utf-8')).hexdigest()[:16]
+
+
+def parse_attendees(event):
+    """Attendee count as an int; non-numeric or negative values are warned about and counted as 0."""
+    value = event.get('attendees')
+    try:
+        count = int(value or 0)
+    except (ValueError, TypeError):
+        count = -1
+    if count < 0:
+        print(f'⚠️  Warning: Invalid attendees "{value}" for "{event.get("title", event.get("id", "?"))}". Using 0.')
+        return 0
+    return count
+
+
+def rollup_year(events):
+    """One pass over a year's events -> partial counts (plain dicts, JSON-serialisable)."""
+    by_type = Counter()
+    attendees_by_type = Counter()
+    by_month = Counter()
+    collaborators = Counter()
+    venues = Counter()
+    attendees = 0
+
+    for event in events:
+        event_type = event.get('type', 'social')
+        count = parse_attendees(event)
+        by_type[event_type] += 1
+        attendees_by_type[event_type] += count
+        attendees += count
+
+        date = event.get('date') or ''
+        if len(date) >= 7 and date[:4].isdigit():
+            by_month[date[:7]] += 1
+
+        for collaborator in event.get('collaborators') or []:
+            if collaborator != HOST_SOCIETY:
+                collaborators[collaborator] += 1
+
+        venue = (event.get('venue') or 'TBA').strip()
+        if venue.upper() != 'TBA':
+            venues[venue] += 1
+
+    return {
+        'events': len(events),
+        'attendees': attendees,
+        'byType': dict(by_type),
+        'attendeesByType': dict(attendees_by_type),
+        'byMonth': dict(by_month),
+        'collaborators': dict(collaborators),
+        'venues': dict(venues),
+    }
+
+
+def merge_rollups(partials):
+    """Combine {year: partial} into the published events_stats.json structure."""
+    by_type = Counter()
+    attendees_by_type = Counter()
+    by_month = Counter()
+    collaborators = Counter()
+    venues = Counter()
+    by_year = {}
+
+    for year in sorted(partials):
+        part = partials[year]
+        by_type.update(part['byType'])
+        attendees_by_type.update(part['attendeesByType'])
+        by_month.update(part['byMonth'])
+        collaborators.update(part['collaborators'])
+        venues.update(part['venues'])
+        by_year[year] = {
+            'events': part['events'],
+            'attendees': part['attendees'],
+            'byType': dict(sorted(part['byType'].items())),
+        }
+
+    return {
+        'version': STATS_VERSION,
+        'totals': {
+            'events': sum(p['events'] for p in partials.values()),
+            'attendees': sum(p['attendees'] for p in partials.values()),
+        },
+        'byType': {
+            t: {'events': by_type[t], 'attendees': attendees_by_type[t]} for t in sorted(by_type)
+        },
+        'byYear': by_year,
+        'byMonth': dict(sorted(by_month.items())),
+        'topCollaborators': [
+            {'name': name, 'events': n}
+            for name, n in sorted(collaborators.items(), key=lambda kv: (-kv[1], kv[0]))[:TOP_COLLABORATORS]
+        ],
+        'venues': dict(sorted(venues.items(), key=lambda kv: (-kv[1], kv[0]))),
+    }
+
+
+def build_events_stats(events_path, output_path):
+    print(f'📖 Reading {events_path}')
+    with open(events_path, 'r', encoding='utf-8') as f:
+        events = json.load(f).get('events', [])
+
+    cache_path = os.path.join(os.path.dirname(output_path) or '.', CACHE_NAME)
+    cache = {}
+    if os.path.exists(cache_path) and os.path.exists(output_path):
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('version') == STATS_VERSION:
+            cache = cached.get('years', {})
+
+    partials = {}
+    new_cache = {}
+    rebuilt = []
+    for year, year_events in group_by_year(events).items():
+        fp = fingerprint(year_events)
+        if cache.get(year, {}).get('fingerprint') == fp:
+            partials[year] = cache[year]['rollup']
+        else:
+            partials[year] = rollup_year(year_events)
+            rebuilt.append(year)
+        new_cache[year] = {'fingerprint': fp, 'rollup': partials[year]}
+
+    removed = sorted(set(cache) - set(new_cache))
+    reused = len(partials) - len(rebuilt)
+    print(f'📊 Years re-aggregated: {sorted(rebuilt) or "none"}, reused from cache: {reused}'
+          + (f', removed: {removed}' if removed else ''))
+
+    if new_cache != cache:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': STATS_VERSION, 'years': new_cache}, f, separators=(',', ':'))
+
+    # Merging is cheap, so always redo it: TOP_COLLABORATORS or the output
+    # shape may have changed even when no year did
+    stats = merge_rollups(partials)
+    previous = None
+    if os.path.exists(output_path):
+        with open(output_path, 'r', encoding='utf-8') as f:
+            try:
+                previous = json.load(f)
+            except json.JSONDecodeError:
+                pass
+    if stats == previous:
+        print(f'✅ Stats are up to date: {output_path}')
+        return
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(stats, f, indent=2, ensure_ascii=False)
+
+    print(f'\n✅ Aggregated {stats["totals"]["events"]} events across {len(partials)} year(s)')
+    print(f'📁 Saved to: {output_path}')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print('\n📘 Usage: python3 buildEventsStats.py <events-json> [output-json]')
+        print('\n📝 Example:')
+        print('  python3 buildEventsStats.py src/data/events.json src/data/events_stats.json\n')
+        sys.exit(1)
+
+    events_path = sys.argv[1]
+    output_path = sys.argv[2] if len(sys.argv) > 2 else 'events_stats.json'
+
+    build_events_stats(events_path, output_path)
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Build a compact search index over events.json and opportunities.json
+Run after convertExcelToJson.py / convertOpportunitiesExcelToJson.py.
+
+Indexed fields:
+  events         title, description, venue, collaborators
+  opportunities  title, description, sponsor
+
+Output (search_index.json, written with no whitespace so it can ship to the browser):
+  docs      [record id, ...]                       position in this list = doc number
+  terms     [token, ...]                           sorted, position = term number
+  postings  [[doc number, ...], ...]               one sorted list per term
+  prefixes  {"py": [first_term, end_term], ...}    1-3 char prefix -> range in `terms`
+  trigrams  {"pyt": [term number, ...], ...}       for typo-tolerant matching
+
+Incremental builds: tokens are cached by a fingerprint of each record's text in
+.search_index_cache.json next to the output, so only new or edited records are
+re-tokenised (ids shifting after an insert doesn't count as a change) and the
+index file is left untouched when nothing changed.
+
+Usage:
+  python3 buildSearchIndex.py src/data/events.json src/data/opportunities.json src/data/search_index.json
+  python3 buildSearchIndex.py --query "python workshop" src/data/search_index.json
+  python3 buildSearchIndex.py --benchmark 100000
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import time
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+from itertools import accumulate
+
+INDEX_VERSION = 1
+CACHE_VERSION = 2
+CACHE_NAME = '.search_index_cache.json'
+MAX_PREFIX = 3
+FUZZY_MIN_SIMILARITY = 0.6
+
+EVENT_FIELDS = ['title', 'description', 'venue', 'collaborators']
+OPPORTUNITY_FIELDS = ['title', 'description', 'sponsor']
+
+# Words that appear in nearly every description and only bloat the postings
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is',
+    'it', 'of', 'on', 'or', 'the', 'their', 'this', 'to', 'with', 'will', 'you', 'your',
+}
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+
+def raw_tokens(text):
+    """Lowercase, strip accents and HTML entities, and split into words (stopwords kept)."""
+    text = unicodedata.normalize('NFKD', text.replace('&amp;', '&'))
+    text = text.encode('ascii', 'ignore').decode('ascii').lower()
+    return TOKEN_RE.findall(text)
+
+
+def normalise_tokens(text):
+    """Search tokens for `text`: raw_tokens() without stopwords."""
+    return [t for t in raw_tokens(text) if t not in STOPWORDS]
+
+
+def record_text(record, fields):
+    parts = []
+    for field in fields:
+        value = record.get(field)
+        if isinstance(value, list):
+            parts.extend(str(v) for v in value)
+        elif value:
+            parts.append(str(value))
+    return '\n'.join(parts)
+
+
+def trigrams(term):
+    padded = f' {term} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def load_records(events_path, opportunities_path):
+    """Return [(id, text)] for every record in the two converter outputs."""
+    records = []
+    for path, key, fields in (
+        (events_path, 'events', EVENT_FIELDS),
+        (opportunities_path, 'opportunities', OPPORTUNITY_FIELDS),
+    ):
+        if not path or not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for record in data.get(key, []):
+            records.append((record['id'], record_text(record, fields)))
+    return records
+
+
+def tokenise_records(records, cache=None):
+    """
+    Return ({id: fingerprint}, {fingerprint: tokens}, number of records not found in the cache).
+    The cache is keyed by content fingerprint, not id, because the converters
+    number ids by sorted position and one early insert renumbers every later record.
+    """
+    cache = cache or {}
+    doc_fingerprints = {}
+    tokens = {}
+    changed = 0
+    for doc_id, text in records:
+        fingerprint = hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+        doc_fingerprints[doc_id] = fingerprint
+        if fingerprint in cache:
+            tokens[fingerprint] = cache[fingerprint]
+            continue
+        changed += 1
+        if fingerprint not in tokens:
+            tokens[fingerprint] = sorted(set(normalise_tokens(text)))
+    return doc_fingerprints, tokens, changed
+
+
+def build_index(doc_fingerprints, tokens):
+    """Invert {id: fingerprint} + {fingerprint: tokens} into the shipped index structure."""
+    docs = list(doc_fingerprints)
+    postings_by_term = {}
+    for doc_num, doc_id in enumerate(docs):
+        for token in tokens[doc_fingerprints[doc_id]]:
+            postings_by_term.setdefault(token, []).append(doc_num)
+
+    terms = sorted(postings_by_term)
+    postings = [postings_by_term[t] for t in terms]
+
+    prefixes = {}
+    for term_num, term in enumerate(terms):
+        for length in range(1, min(MAX_PREFIX, len(term)) + 1):
+            prefix = term[:length]
+            if prefix in prefixes:
+                prefixes[prefix][1] = term_num + 1
+            else:
+                prefixes[prefix] = [term_num, term_num + 1]
+
+    trigram_table = {}
+    for term_num, term in enumerate(terms):
+        for gram in trigrams(term):
+            trigram_table.setdefault(gram, []).append(term_num)
+
+    return {
+        'version': INDEX_VERSION,
+        'docs': docs,
+        'terms': terms,
+        'postings': postings,
+        'prefixes': prefixes,
+        'trigrams': trigram_table,
+    }
+
+
+def write_json(data, path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+
+
+class SearchIndex:
+    """Query API over a built (or loaded) search index."""
+
+    def __init__(self, index):
+        self.docs = index['docs']
+        self.terms = index['terms']
+        self.postings = index['postings']
+        self.prefixes = index['prefixes']
+        self.trigrams = index['trigrams']
+        self._term_numbers = {t: i for i, t in enumerate(self.terms)}
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def _prefix_terms(self, token):
+        """Term numbers starting with `token`, narrowed via the prefix table."""
+        bucket = self.prefixes.get(token[:MAX_PREFIX])
+        if not bucket:
+            return []
+        start, end = bucket
+        if len(token) <= MAX_PREFIX:
+            return range(start, end)
+        lo = bisect_left(self.terms, token, start, end)
+        hi = lo
+        while hi < end and self.terms[hi].startswith(token):
+            hi += 1
+        return range(lo, hi)
+
+    def _fuzzy_terms(self, token, min_similarity=FUZZY_MIN_SIMILARITY):
+        """
+        Term numbers whose trigram sets are similar to the token's (Dice coefficient,
+        2 * shared / (token trigrams + term trigrams)), so a long term that merely
+        contains a few of the token's trigrams doesn't count as a typo match.
+        """
+        grams = trigrams(token)
+        counts = {}
+        for gram in grams:
+            for term_num in self.trigrams.get(gram, ()):
+                counts[term_num] = counts.get(term_num, 0) + 1
+        return [
+            n for n, shared in counts.items()
+            if 2 * shared / (len(grams) + len(trigrams(self.terms[n]))) >= min_similarity
+        ]
+
+    def _matching_docs(self, token, prefix):
+        term_num = self._term_numbers.get(token)
+        if term_num is not None and not prefix:
+            return set(self.postings[term_num])
+        term_nums = self._prefix_terms(token) if prefix else []
+        if not term_nums:
+            term_nums = self._fuzzy_terms(token)
+        docs = set()
+        for n in term_nums:
+            docs.update(self.postings[n])
+        return docs
+
+    def search(self, query, limit=20, prefix_last=True):
+        """
+        Return record ids matching every token in `query`.
+        The last token is prefix-matched (search-as-you-type); unknown tokens fall
+        back to trigram matching. Results keep the converters' sort order.
+        """
+        words = raw_tokens(query)
+        if not words:
+            return []
+        # A half-typed last word ("an", "in") is often a stopword but still a
+        # prefix of real terms ("analytics", "industry"), so only drop stopwords
+        # from the finished words before it
+        terms = [(t, False) for t in words[:-1] if t not in STOPWORDS]
+        if prefix_last:
+            terms.append((words[-1], True))
+        elif words[-1] not in STOPWORDS:
+            terms.append((words[-1], False))
+        if not terms:
+            return []
+        candidates = [self._matching_docs(t, prefix) for t, prefix in terms]
+        # Intersect smallest sets first so the candidate set shrinks quickly
+        candidates.sort(key=len)
+        matches = candidates[0]
+        for docs in candidates[1:]:
+            if not matches:
+                return []
+            matches = matches & docs
+        return [self.docs[n] for n in sorted(matches)[:limit]]
+
+
+def build_search_index(events_path, opportunities_path, output_path):
+    print(f'📖 Reading {events_path} and {opportunities_path}')
+    records = load_records(events_path, opportunities_path)
+
+    cache_path = os.path.join(os.path.dirname(output_path) or '.', CACHE_NAME)
+    cache = {}
+    previous_ids = {}
+    if os.path.exists(cache_path) and os.path.exists(output_path):
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('version') == CACHE_VERSION:
+            cache = cached.get('tokens', {})
+            previous_ids = cached.get('ids', {})
+
+    doc_fingerprints, tokens, changed = tokenise_records(records, cache)
+    # Records (not distinct fingerprints) present last time but gone now
+    removed = sum((Counter(previous_ids.values()) - Counter(doc_fingerprints.values())).values())
+    print(f'🔎 {len(records)} records: {changed} new/changed, {removed} removed, '
+          f'{len(records) - changed} reused from cache')
+
+    if cache and list(previous_ids.items()) == list(doc_fingerprints.items()):
+        print(f'✅ Search index is up to date: {output_path}')
+        return SearchIndex.load(output_path)
+
+    index = build_index(doc_fingerprints, tokens)
+    write_json(index, output_path)
+    write_json({'version': CACHE_VERSION, 'ids': doc_fingerprints, 'tokens': tokens}, cache_path)
+
+    size_kb = os.path.getsize(output_path) / 1024
+    print(f'✅ Indexed {len(index["docs"])} records, {len(index["terms"])} terms ({size_kb:.1f} KB)')
+    print(f'📁 Saved to: {output_path}')
+    return SearchIndex(index)
+
+
+def run_benchmark(n_records, n_queries=1000, seed=0):
+    """Build an index over `n_records` synthetic records and time queries."""
+    rng = random.Random(seed)
+    vocab = [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 10)))
+             for _ in range(20000)]
+    # Zipf-ish word frequencies, like real descriptions
+    cum_weights = list(accumulate(1 / (i + 1) for i in range(len(vocab))))
+
+    print(f'🧪 Generating {n_records} synthetic records...')
+    records = [(f'event_{i:06d}', ' '.join(rng.choices(vocab, cum_weights=cum_weights, k=rng.randint(15, 60))))
+               for i in range(n_records)]
+
+    start = time.perf_counter()
+    doc_fingerprints, tokens, _ = tokenise_records(records)
+    index = build_index(doc_fingerprints, tokens)
+    build_s = time.perf_counter() - start
+    size_mb = len(json.dumps(index, separators=(',', ':'))) / 1024 / 1024
+    print(f'🏗️  Built index in {build_s:.2f}s: {len(index["terms"])} terms, {size_mb:.1f} MB')
+
+    start = time.perf_counter()
+    tokenise_records(records, tokens)
+    print(f'♻️  Incremental rebuild check (no changes): {time.perf_counter() - start:.2f}s')
+
+    search = SearchIndex(index)
+    query_sets = {
+        'single term': [rng.choice(vocab) for _ in range(n_queries)],
+        'two terms': [f'{rng.choice(vocab)} {rng.choice(vocab[:500])}' for _ in range(n_queries)],
+        'prefix (3 chars)': [rng.choice(vocab)[:3] for _ in range(n_queries)],
+        'typo': [rng.choice(vocab)[:-1] + 'q' for _ in range(n_queries)],
+    }
+    for label, queries in query_sets.items():
+        timings = []
+        for q in queries:
+            t0 = time.perf_counter()
+            search.search(q)
+            timings.append(time.perf_counter() - t0)
+        timings.sort()
+        p50 = timings[len(timings) // 2] * 1000
+        p95 = timings[int(len(timings) * 0.95)] * 1000
+        print(f'   {label:<18} p50 {p50:7.3f} ms   p95 {p95:7.3f} ms')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build or query the events/opportunities search index.')
+    parser.add_argument('paths', nargs='*', help='<events.json> <opportunities.json> <output.json>, or <index.json> with --query')
+    parser.add_argument('--query', help='Run a query against an existing index')
+    parser.add_argument('--limit', type=int, default=20, help='Maximum results for --query')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='Benchmark on N synthetic records')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args.benchmark)
+    elif args.query is not None:
+        index_path = args.paths[0] if args.paths else 'search_index.json'
+        for doc_id in SearchIndex.load(index_path).search(args.query, limit=args.limit):
+            print(doc_id)
+    elif len(args.paths) == 3:
+        build_search_index(*args.paths)
+    else:
+        print('\n📘 Usage: python3 buildSearchIndex.py <events.json> <opportunities.json> <output-json>')
+        print('\n📝 Example:')
+        print('  python3 buildSearchIndex.py src/data/events.json src/data/opportunities.json src/data/search_index.json\n')
+        print('💡 Query it:   python3 buildSearchIndex.py --query "python" src/data/search_index.json')
+        print('   Benchmark:  python3 buildSearchIndex.py --benchmark 100000\n')
+        sys.exit(1)
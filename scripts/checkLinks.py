@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Check signupLink (events.json) and applicationLink (opportunities.json) URLs
+Run after convertExcelToJson.py / convertOpportunitiesExcelToJson.py.
+
+- Flags placeholder links (e.g. the https://forms.google.com/example default)
+- Checks every other URL concurrently: at most --max-connections requests in
+  flight overall, at most --per-host at once per host, and --host-interval
+  seconds between request starts to the same host
+- Results are cached in .link_check_cache.json next to the first input file;
+  working links are not rechecked until --ttl hours have passed, broken links
+  are rechecked every run
+
+Usage:
+  python3 checkLinks.py src/data/events.json src/data/opportunities.json
+  python3 checkLinks.py --strict src/data/events.json src/data/opportunities.json   # exit 1 on problems
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+CACHE_NAME = '.link_check_cache.json'
+USER_AGENT = 'Mozilla/5.0 (compatible; SUDATA-link-checker)'
+
+# Link fields written by the converters, per top-level key
+LINK_FIELDS = {
+    'events': 'signupLink',
+    'opportunities': 'applicationLink',
+}
+
+PLACEHOLDER_HOSTS = {'example.com', 'www.example.com', 'example.org', 'localhost'}
+PLACEHOLDER_URLS = {'https://forms.google.com/example'}
+
+
+def placeholder_reason(url):
+    """Return why `url` is a placeholder/invalid link, or None if it looks real."""
+    if not url:
+        return 'missing link'
+    if url.rstrip('/') in PLACEHOLDER_URLS:
+        return 'converter default placeholder'
+    parsed = urlparse(url)
+    if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+        return 'not an http(s) URL'
+    if parsed.hostname in PLACEHOLDER_HOSTS or parsed.path.rstrip('/').endswith('/example'):
+        return 'placeholder URL'
+    return None
+
+
+def collect_links(json_paths):
+    """Return {url: [(record id, title), ...]} for every link field in the inputs."""
+    links = {}
+    for path in json_paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for key, field in LINK_FIELDS.items():
+            for record in data.get(key, []):
+                url = (record.get(field) or '').strip()
+                links.setdefault(url, []).append((record.get('id', '?'), record.get('title', '')))
+    return links
+
+
+def fetch_status(url, timeout):
+    """
+    Blocking HEAD request (falling back to GET). Returns (status code, error).
+    The `timeout` budget covers both attempts and starts when this call does,
+    so time spent queued for a worker thread never counts against it.
+    """
+    deadline = time.monotonic() + timeout
+    for method in ('HEAD', 'GET'):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None, 'timed out'
+        request = urllib.request.Request(url, method=method, headers={'User-Agent': USER_AGENT})
+        try:
+            with urllib.request.urlopen(request, timeout=remaining) as response:
+                return response.status, None
+        except urllib.error.HTTPError as error:
+            # Plenty of sites reject HEAD; retry those with GET
+            if method == 'HEAD' and error.code in (403, 404, 405, 501):
+                continue
+            return error.code, None
+        except Exception as error:
+            reason = getattr(error, 'reason', error)
+            if isinstance(reason, (socket.timeout, TimeoutError)):
+                return None, 'timed out'
+            return None, str(reason)
+    return None, 'no response'
+
+
+class LinkChecker:
+    """Concurrent URL checker with a global connection limit and per-host rate limits."""
+
+    def __init__(self, max_connections=16, per_host=2, host_interval=0.5, timeout=10.0):
+        self.max_connections = max_connections
+        self.per_host = per_host
+        self.host_interval = host_interval
+        self.timeout = timeout
+        self._executor = None
+        self._host_slots = {}
+        self._host_next_start = {}
+
+    async def _wait_for_host(self, host):
+        """Reserve the next start slot for `host`, sleeping until it arrives."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start = max(now, self._host_next_start.get(host, now))
+        self._host_next_start[host] = start + self.host_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def _fetch(self, url):
+        """
+        Run fetch_status on the executor (max_connections threads, which bounds
+        requests in flight) with a hard overall deadline. urlopen's timeout is per
+        socket operation and doesn't cover DNS, so the deadline is enforced here too;
+        it starts when a worker picks the job up, not while it waits in the queue.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.create_future()
+
+        def run():
+            loop.call_soon_threadsafe(lambda: started.done() or started.set_result(loop.time()))
+            return fetch_status(url, self.timeout)
+
+        future = loop.run_in_executor(self._executor, run)
+        await asyncio.wait({started, future}, return_when=asyncio.FIRST_COMPLETED)
+        start = started.result() if started.done() else loop.time()
+        remaining = max(0.0, start + self.timeout - loop.time())
+        try:
+            return await asyncio.wait_for(future, timeout=remaining)
+        except asyncio.TimeoutError:
+            return None, 'timed out'
+
+    async def check(self, url):
+        host = urlparse(url).netloc.lower()
+        slots = self._host_slots.setdefault(host, asyncio.Semaphore(self.per_host))
+        async with slots:
+            await self._wait_for_host(host)
+            status, error = await self._fetch(url)
+        return {
+            'status': status,
+            'ok': status is not None and 200 <= status < 400,
+            'error': error,
+            'checked_at': time.time(),
+        }
+
+    async def check_all(self, urls):
+        """Return {url: result} for every url, checked concurrently."""
+        self._executor = ThreadPoolExecutor(max_workers=self.max_connections)
+        try:
+            results = await asyncio.gather(*(self.check(url) for url in urls))
+        finally:
+            # Don't block on workers stuck past their deadline (e.g. a hung DNS lookup)
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        return dict(zip(urls, results))
+
+
+def load_cache(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (ValueError, OSError):
+        return {}
+
+
+def check_links(json_paths, ttl_hours=24.0, checker=None, cache_path=None):
+    """
+    Check every link in `json_paths`. Returns a list of problem dicts
+    ({'url', 'reason', 'records'}); an empty list means all links are fine.
+    """
+    checker = checker or LinkChecker()
+    cache_path = cache_path or os.path.join(os.path.dirname(json_paths[0]) or '.', CACHE_NAME)
+
+    links = collect_links(json_paths)
+    print(f'🔗 Found {len(links)} unique link(s) in {len(json_paths)} file(s)')
+
+    problems = []
+    to_check = []
+    for url, records in links.items():
+        reason = placeholder_reason(url)
+        if reason:
+            problems.append({'url': url, 'reason': reason, 'records': records})
+        else:
+            to_check.append(url)
+
+    cache = load_cache(cache_path)
+    now = time.time()
+    fresh = {
+        url: cache[url] for url in to_check
+        if url in cache and cache[url].get('ok') and now - cache[url].get('checked_at', 0) < ttl_hours * 3600
+    }
+    stale = [url for url in to_check if url not in fresh]
+    print(f'♻️  {len(fresh)} cached, {len(stale)} to check')
+
+    results = asyncio.run(checker.check_all(stale)) if stale else {}
+    cache.update(results)
+    # Drop links no longer referenced so the cache doesn't grow forever
+    cache = {url: result for url, result in cache.items() if url in links}
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+
+    for url in to_check:
+        result = fresh.get(url) or results[url]
+        if not result['ok']:
+            reason = f'HTTP {result["status"]}' if result['status'] else result['error']
+            problems.append({'url': url, 'reason': reason, 'records': links[url]})
+
+    if problems:
+        print(f'\n⚠️  {len(problems)} problem link(s):')
+        for problem in problems:
+            print(f'   ❌ {problem["url"] or "(empty)"} — {problem["reason"]}')
+            for record_id, title in problem['records']:
+                print(f'      • {record_id}: {title}')
+    else:
+        print('\n✅ All links OK')
+
+    return problems
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Check signup/application links in the converted JSON files.')
+    parser.add_argument('paths', nargs='*', help='events.json and/or opportunities.json')
+    parser.add_argument('--ttl', type=float, default=24.0, help='Hours before a working link is rechecked')
+    parser.add_argument('--max-connections', type=int, default=16, help='Maximum concurrent requests')
+    parser.add_argument('--per-host', type=int, default=2, help='Maximum concurrent requests per host')
+    parser.add_argument('--host-interval', type=float, default=0.5, help='Seconds between requests to one host')
+    parser.add_argument('--timeout', type=float, default=10.0, help='Per-request timeout in seconds')
+    parser.add_argument('--strict', action='store_true', help='Exit with status 1 if any link has a problem')
+    args = parser.parse_args()
+
+    if not args.paths:
+        print('\n📘 Usage: python3 checkLinks.py <json-file> [json-file ...]')
+        print('\n📝 Example:')
+        print('  python3 checkLinks.py src/data/events.json src/data/opportunities.json\n')
+        sys.exit(1)
+
+    checker = LinkChecker(args.max_connections, args.per_host, args.host_interval, args.timeout)
+    problems = check_links(args.paths, ttl_hours=args.ttl, checker=checker)
+    if problems and args.strict:
+        sys.exit(1)
@@ -6,18 +6,31 @@ Excel format:
 - Row 1: Headers (event_title, date, time, venue, type, description, collaborators, catering, signup_link)
 - Row 2+: Actual event data
 """
-import json
 import sys
+from collections import namedtuple
 from openpyxl import load_workbook
 from datetime import datetime
 import re
+from jsonStream import sorted_order, write_records_json
+
+# Events are held as tuples while converting; field order matches events.json
+Event = namedtuple('Event', [
+    'title', 'date', 'time', 'venue', 'type', 'description',
+    'collaborators', 'catering', 'signupLink', 'attendees',
+])
+
+
+def event_to_dict(idx, event):
+    data = event._asdict()
+    data['id'] = f"event_{str(idx).zfill(3)}"
+    return data
 
 def convert_excel_to_json(excel_path, output_path):
     try:
         print(f'📖 Reading Excel file: {excel_path}')
         
-        # Load workbook
-        wb = load_workbook(excel_path)
+        # Load workbook (read-only streams rows instead of loading every cell object)
+        wb = load_workbook(excel_path, read_only=True)
         
         # Find all event sheets (exclude Instructions sheet)
         event_sheets = [sheet for sheet in wb.sheetnames if sheet.lower() != 'instructions']
@@ -25,6 +38,7 @@ def convert_excel_to_json(excel_path, output_path):
         print(f'📄 Found {len(event_sheets)} event sheet(s): {event_sheets}')
         
         all_events = []
+        sort_keys = []
         
         # Process each sheet
         for sheet_name in event_sheets:
@@ -46,7 +60,7 @@ def convert_excel_to_json(excel_path, output_path):
                 continue
             
             # Read data rows
-            sheet_events = []
+            sheet_count = 0
             for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
                 # Skip empty rows
                 if not any(row):
@@ -119,38 +133,37 @@ def convert_excel_to_json(excel_path, output_path):
                     print(f'⚠️  Warning: Invalid type "{event_type}" for "{event_title}". Using "social".')
                     event_type = 'social'
                 
+                if not row_data.get('signup_link'):
+                    print(f'⚠️  Warning: No signup_link for "{event_title}". Using placeholder link.')
+                
                 # Create event object
-                event = {
-                    'title': event_title,
-                    'date': formatted_date,
-                    'time': formatted_time,
-                    'venue': str(row_data.get('venue', 'TBA')).strip() if row_data.get('venue') else 'TBA',
-                    'type': event_type,
-                    'description': str(row_data.get('description', '')).strip() if row_data.get('description') else '',
-                    'collaborators': collaborators if collaborators else ['SUDATA'],
-                    'catering': str(row_data.get('catering', 'None')).strip() if row_data.get('catering') else 'None',
-                    'signupLink': str(row_data.get('signup_link', 'https://forms.google.com/example')).strip() if row_data.get('signup_link') else 'https://forms.google.com/example',
-                    'attendees': 0
-                }
+                event = Event(
+                    title=event_title,
+                    date=formatted_date,
+                    time=formatted_time,
+                    venue=str(row_data.get('venue', 'TBA')).strip() if row_data.get('venue') else 'TBA',
+                    type=event_type,
+                    description=str(row_data.get('description', '')).strip() if row_data.get('description') else '',
+                    collaborators=collaborators if collaborators else ['SUDATA'],
+                    catering=str(row_data.get('catering', 'None')).strip() if row_data.get('catering') else 'None',
+                    signupLink=str(row_data.get('signup_link', 'https://forms.google.com/example')).strip() if row_data.get('signup_link') else 'https://forms.google.com/example',
+                    attendees=0,
+                )
                 
-                sheet_events.append(event)
+                all_events.append(event)
+                sort_keys.append((formatted_date, formatted_time))
+                sheet_count += 1
             
-            print(f'✅ Loaded {len(sheet_events)} events from "{sheet_name}"')
-            all_events.extend(sheet_events)
-        
-        # Sort all events by date
-        all_events.sort(key=lambda x: (x['date'], x['time']))
+            print(f'✅ Loaded {sheet_count} events from "{sheet_name}"')
         
-        # Assign IDs after sorting
-        for idx, event in enumerate(all_events, 1):
-            event['id'] = f"event_{str(idx).zfill(3)}"
+        wb.close()
         
-        # Create output JSON
-        output = {'events': all_events}
+        # Sort all events by date (only the key tuples are sorted)
+        order = sorted_order(sort_keys)
+        del sort_keys
         
-        # Write to file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        # Stream to file, assigning IDs in sorted order
+        write_records_json(output_path, 'events', (all_events[i] for i in order), event_to_dict)
         
         print(f'\n✅ Successfully converted {len(all_events)} total events from {len(event_sheets)} sheet(s)')
         print(f'📁 Saved to: {output_path}')
@@ -9,6 +9,8 @@ Columns:
   opportunity_title  | Title of the opportunity
   sponsor            | Sponsor company name (must match a current sponsor)
   sponsor_logo       | Path to sponsor logo, e.g. /sponsors/current-sponsors/imc-trading.webp
+                     | (checked against public/sponsors/; auto-filled from the sponsor name if blank)
+                     | (replaced by its optimised WebP variant if sponsorRegistry.py --optimise built one)
   sponsor_tier       | Display order: 1=Industry Partner, 2=Technical, 3=Recruitment/Sponsor (optional, default 99)
   type               | Internship | Graduate | Program | Part-Time | Full-Time | Scholarship | Others
   deadline           | YYYY-MM-DD, or leave blank for rolling/no deadline
@@ -19,10 +21,12 @@ Columns:
 Usage:
   python3 convertOpportunitiesExcelToJson.py opportunities_template.xlsx src/data/opportunities.json
 """
-import json
 import sys
+from collections import namedtuple
 from openpyxl import load_workbook
 from datetime import datetime
+from jsonStream import sorted_order, write_records_json
+from sponsorRegistry import SponsorRegistry
 
 VALID_STATUSES = ['open', 'closed']
 VALID_TYPES = ['Internship', 'Graduate', 'Program', 'Part-Time', 'Full-Time', 'Scholarship', 'Others']
@@ -31,6 +35,18 @@ REQUIRED_HEADERS = [
     'deadline', 'status', 'description', 'application_link'
 ]
 
+# Opportunities are held as tuples while converting; field order matches opportunities.json
+Opportunity = namedtuple('Opportunity', [
+    'sponsor', 'sponsorTier', 'sponsorLogo', 'title', 'type',
+    'deadline', 'status', 'description', 'applicationLink',
+])
+
+
+def opportunity_to_dict(idx, opp):
+    data = opp._asdict()
+    data['id'] = f'opp_{str(idx).zfill(3)}'
+    return data
+
 
 def parse_date(value):
     """Return YYYY-MM-DD string or None for rolling/blank deadlines."""
@@ -65,7 +81,7 @@ def convert_excel_to_json(excel_path, output_path):
     try:
         print(f'📖 Reading Excel file: {excel_path}')
 
-        wb = load_workbook(excel_path)
+        wb = load_workbook(excel_path, read_only=True)
 
         # Find the Opportunities sheet (skip Instructions)
         opp_sheets = [s for s in wb.sheetnames if s.lower() != 'instructions']
@@ -76,7 +92,12 @@ def convert_excel_to_json(excel_path, output_path):
 
         print(f'📄 Found sheet(s): {opp_sheets}')
 
+        # Index public/sponsors/ once so each row's logo check is a dict lookup
+        sponsors = SponsorRegistry()
+        print(f'📇 Indexed {len(sponsors)} sponsor logo(s)')
+
         all_opportunities = []
+        sort_keys = []
 
         for sheet_name in opp_sheets:
             ws = wb[sheet_name]
@@ -93,7 +114,7 @@ def convert_excel_to_json(excel_path, output_path):
                 print('    Skipping this sheet.')
                 continue
 
-            sheet_opps = []
+            sheet_count = 0
             for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
                 if not any(row):
                     continue  # Skip blank rows
@@ -114,6 +135,11 @@ def convert_excel_to_json(excel_path, output_path):
 
                 # --- sponsor_logo ---
                 sponsor_logo = str(row_data.get('sponsor_logo', '')).strip() if row_data.get('sponsor_logo') else ''
+                sponsor_logo, logo_warnings = sponsors.validate_logo(sponsor, sponsor_logo)
+                for warning in logo_warnings:
+                    print(f'⚠️  "{title}": {warning}')
+                # Serve the optimised WebP variant when sponsorRegistry.py --optimise has built one
+                sponsor_logo = sponsors.optimised_logo(sponsor_logo)
 
                 # --- sponsor_tier (optional, controls display order) ---
                 tier_raw = row_data.get('sponsor_tier')
@@ -143,39 +169,32 @@ def convert_excel_to_json(excel_path, output_path):
                 # --- application_link ---
                 app_link = str(row_data.get('application_link', '')).strip() if row_data.get('application_link') else ''
 
-                opp = {
-                    'sponsor': sponsor,
-                    'sponsorTier': sponsor_tier,
-                    'sponsorLogo': sponsor_logo,
-                    'title': title,
-                    'type': opp_type,
-                    'deadline': deadline,
-                    'status': status,
-                    'description': description,
-                    'applicationLink': app_link,
-                }
-
-                sheet_opps.append(opp)
-
-            print(f'✅ Loaded {len(sheet_opps)} opportunities from "{sheet_name}"')
-            all_opportunities.extend(sheet_opps)
+                opp = Opportunity(
+                    sponsor=sponsor,
+                    sponsorTier=sponsor_tier,
+                    sponsorLogo=sponsor_logo,
+                    title=title,
+                    type=opp_type,
+                    deadline=deadline,
+                    status=status,
+                    description=description,
+                    applicationLink=app_link,
+                )
 
-        # Sort: open first, then closed; within each group sort by deadline (None/rolling last)
-        def sort_key(o):
-            status_order = 0 if o['status'] == 'open' else 1
-            deadline = o['deadline'] or 'ZZZZ'  # Push None to end
-            return (status_order, deadline)
+                all_opportunities.append(opp)
+                # Sort key: open first, then closed; within each group by deadline (None/rolling last)
+                sort_keys.append((0 if status == 'open' else 1, deadline or 'ZZZZ'))
+                sheet_count += 1
 
-        all_opportunities.sort(key=sort_key)
+            print(f'✅ Loaded {sheet_count} opportunities from "{sheet_name}"')
 
-        # Assign IDs after sorting
-        for idx, opp in enumerate(all_opportunities, 1):
-            opp['id'] = f'opp_{str(idx).zfill(3)}'
+        wb.close()
 
-        output = {'opportunities': all_opportunities}
+        order = sorted_order(sort_keys)
+        del sort_keys
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        # Stream to file, assigning IDs in sorted order
+        write_records_json(output_path, 'opportunities', (all_opportunities[i] for i in order), opportunity_to_dict)
 
         print(f'\n✅ Successfully converted {len(all_opportunities)} opportunities')
         print(f'📁 Saved to: {output_path}')
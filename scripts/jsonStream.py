@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON writer shared by the Excel -> JSON converters
+
+write_records_json() writes {"<key>": [record, ...]} one record at a time,
+producing exactly the same text as json.dump(..., indent=2, ensure_ascii=False),
+so only one record is ever expanded into a dict instead of keeping a dict
+(plus an 'id' key) per record alive for the whole run.
+
+Records are kept as namedtuples while converting and turned into dicts one
+at a time as they are written; ids are assigned at write time from the sorted
+position instead of mutating every record.
+
+Peak-memory benchmark: benchmarkConverterMemory.py
+"""
+import json
+
+
+def sorted_order(keys):
+    """Indices of `keys` in ascending order; sorts the precomputed key tuples only."""
+    return sorted(range(len(keys)), key=keys.__getitem__)
+
+
+def write_records_json(path, key, records, to_dict):
+    """
+    Stream `records` to `path` as {"<key>": [...]} with indent=2 formatting.
+    `to_dict(index, record)` builds the dict for one record (index starts at 1).
+    Returns the number of records written.
+    """
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    count = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{\n  ' + json.dumps(key) + ': [')
+        for count, record in enumerate(records, 1):
+            encoded = encoder.encode(to_dict(count, record))
+            f.write(',\n    ' if count > 1 else '\n    ')
+            f.write(encoded.replace('\n', '\n    '))
+        f.write('\n  ]\n}' if count else ']\n}')
+    return count
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Index the sponsor logos in public/sponsors/ and optionally build optimised variants
+Used by convertOpportunitiesExcelToJson.py to validate/auto-fill sponsor_logo.
+
+Folders scanned:
+  public/sponsors/current-sponsors/   current sponsors
+  public/sponsors/past-partners/      past partners
+
+A logo matches a sponsor by (names are compared lowercase with spaces and
+punctuation removed):
+  - its file name without the extension ("imc-trading.webp" <-> "IMC Trading")
+  - the display names the site already pairs with it in sponsors.astro and
+    PastPartnersCarousel.jsx ("heidi.png" <-> "Heidi Health")
+  - SPONSOR_ALIASES below, for other spellings used in the spreadsheets
+
+Optimised variants (needs Pillow: pip install pillow):
+  Each raster logo is scaled to fit within --max-width x --max-height and saved
+  as a compressed WebP at public/sponsors/optimised/<folder>/<file name>.webp
+  (e.g. jane-street.png -> optimised/current-sponsors/jane-street.png.webp).
+  convertOpportunitiesExcelToJson.py points sponsorLogo at the variant when one
+  exists, and validate_logo() accepts variant paths as their original logo.
+  Logos whose content hash and settings match the manifest from the last run
+  are skipped, and variants of logos that were deleted are removed. The
+  manifest lives in scripts/.sponsor_logo_manifest.json, outside public/, so it
+  is never deployed with the site.
+
+Usage:
+  python3 sponsorRegistry.py                 # list indexed sponsors
+  python3 sponsorRegistry.py --optimise      # build optimised WebP variants
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PUBLIC_DIR = os.path.join(SCRIPTS_DIR, '..', 'public')
+SPONSOR_GROUPS = {
+    'current-sponsors': 'current',
+    'past-partners': 'past',
+}
+LOGO_EXTENSIONS = {'.png', '.webp', '.jpg', '.jpeg', '.svg'}
+OPTIMISED_DIR = 'optimised'
+MANIFEST_PATH = os.path.join(SCRIPTS_DIR, '.sponsor_logo_manifest.json')
+
+# Files whose `name: '...'` / `src:` or `logo: '...'` pairs give sponsor display names
+SPONSOR_NAME_SOURCES = [
+    os.path.join(SCRIPTS_DIR, '..', 'src', 'pages', 'sponsors.astro'),
+    os.path.join(SCRIPTS_DIR, '..', 'src', 'components', 'PastPartnersCarousel.jsx'),
+]
+NAME_LOGO_RE = re.compile(r"""name:\s*(['"])(.+?)\1.*?(?:src|logo):\s*'(/sponsors/[^']+)'""", re.DOTALL)
+
+# Other names a sponsor goes by -> logo path (add here when a row is wrongly flagged)
+SPONSOR_ALIASES = {
+    'Commonwealth Bank': '/sponsors/past-partners/cba.png',
+    'CommBank': '/sponsors/past-partners/cba.png',
+    'NSW Health': '/sponsors/past-partners/nsw-health.png',
+}
+
+
+def normalise_name(name):
+    """'IMC Trading' / 'imc-trading' -> 'imctrading'"""
+    return re.sub(r'[^a-z0-9]', '', name.lower())
+
+
+class SponsorRegistry:
+    """In-memory index of sponsor logos keyed by normalised name and by public path."""
+
+    def __init__(self, public_dir=PUBLIC_DIR, name_sources=SPONSOR_NAME_SOURCES, aliases=SPONSOR_ALIASES):
+        self.public_dir = public_dir
+        self.name_sources = name_sources
+        self.aliases = aliases
+        self.by_name = {}   # normalised name -> {status: logo entry}
+        self.by_path = {}   # '/sponsors/...' -> logo entry
+        self.by_optimised = {}  # '/sponsors/optimised/...' -> logo entry, for variants that exist
+        self._scan()
+
+    def _scan(self):
+        for folder, status in SPONSOR_GROUPS.items():
+            group_dir = os.path.join(self.public_dir, 'sponsors', folder)
+            if not os.path.isdir(group_dir):
+                continue
+            for file_name in sorted(os.listdir(group_dir)):
+                stem, ext = os.path.splitext(file_name)
+                if ext.lower() not in LOGO_EXTENSIONS:
+                    continue
+                entry = {
+                    'name': stem,
+                    'status': status,
+                    'path': f'/sponsors/{folder}/{file_name}',
+                    'file': os.path.join(group_dir, file_name),
+                    'optimised': None,
+                }
+                if ext.lower() != '.svg':  # vector logos are already resolution independent
+                    entry['optimised'] = f'/sponsors/{OPTIMISED_DIR}/{folder}/{file_name}.webp'
+                    if os.path.exists(self.public_file(entry['optimised'])):
+                        self.by_optimised[entry['optimised']] = entry
+                self._add_name(stem, entry)
+                self.by_path[entry['path']] = entry
+
+        for name, path in self._display_names():
+            entry = self.by_path.get(path)
+            if entry:
+                self._add_name(name, entry)
+
+    def public_file(self, path):
+        """'/sponsors/...' -> file path under public_dir"""
+        return os.path.join(self.public_dir, *path.lstrip('/').split('/'))
+
+    def _add_name(self, name, entry):
+        self.by_name.setdefault(normalise_name(name), {})[entry['status']] = entry
+
+    def _display_names(self):
+        """(name, logo path) pairs from the site's sponsor lists, then SPONSOR_ALIASES."""
+        for source in self.name_sources:
+            if not os.path.exists(source):
+                continue
+            with open(source, 'r', encoding='utf-8') as f:
+                for match in NAME_LOGO_RE.finditer(f.read()):
+                    yield match.group(2), match.group(3)
+        yield from self.aliases.items()
+
+    def lookup(self, sponsor):
+        """Return the logo entry for `sponsor`, preferring the current-sponsor logo."""
+        entries = self.by_name.get(normalise_name(sponsor), {})
+        return entries.get('current') or entries.get('past')
+
+    def is_current(self, sponsor):
+        return 'current' in self.by_name.get(normalise_name(sponsor), {})
+
+    def optimised_logo(self, sponsor_logo):
+        """The optimised variant of `sponsor_logo` if one has been built, else `sponsor_logo` unchanged."""
+        entry = self.by_path.get(sponsor_logo)
+        if entry and entry['optimised'] in self.by_optimised:
+            return entry['optimised']
+        return sponsor_logo
+
+    def validate_logo(self, sponsor, sponsor_logo):
+        """
+        Return (logo path, [warnings]) for an opportunity row; no warnings means OK.
+        A blank sponsor_logo is auto-filled from the sponsor name. Optimised
+        variant paths are checked as the logo they were built from.
+        """
+        warnings = []
+        if not self.is_current(sponsor):
+            known = 'a past partner' if self.lookup(sponsor) else 'not in public/sponsors/'
+            warnings.append(f'sponsor "{sponsor}" is not a current sponsor ({known})')
+
+        if not sponsor_logo:
+            entry = self.lookup(sponsor)
+            if entry:
+                return entry['path'], warnings
+            warnings.append(f'no logo found for sponsor "{sponsor}"')
+            return '', warnings
+
+        entry = self.by_path.get(sponsor_logo) or self.by_optimised.get(sponsor_logo)
+        if entry is None:
+            suggestion = self.lookup(sponsor)
+            hint = f' (did you mean {suggestion["path"]}?)' if suggestion else ''
+            warnings.append(f'logo "{sponsor_logo}" does not exist in public/{hint}')
+        elif entry not in self.by_name.get(normalise_name(sponsor), {}).values():
+            warnings.append(f'logo "{sponsor_logo}" does not match sponsor "{sponsor}"')
+        return sponsor_logo, warnings
+
+    def __len__(self):
+        return len(self.by_path)
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def optimise_logos(registry, max_width=400, max_height=200, webp_quality=85, manifest_path=MANIFEST_PATH):
+    """
+    Write a size-normalised, compressed WebP variant of every raster logo and
+    delete variants whose logo no longer exists.
+    Returns (number written, number skipped because unchanged, number removed).
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        print('❌ Pillow is required for --optimise: pip install pillow')
+        sys.exit(1)
+
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+
+    settings = [max_width, max_height, webp_quality]
+    written = skipped = 0
+    new_manifest = {}
+    outputs = set()
+
+    for path, entry in sorted(registry.by_path.items()):
+        if not entry['optimised']:
+            continue
+        output = os.path.normpath(registry.public_file(entry['optimised']))
+        outputs.add(output)
+
+        record = {'hash': file_hash(entry['file']), 'settings': settings}
+        new_manifest[path] = record
+        if manifest.get(path) == record and os.path.exists(output):
+            skipped += 1
+            continue
+
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        with Image.open(entry['file']) as img:
+            img = img.convert('RGBA')
+            img.thumbnail((max_width, max_height), Image.LANCZOS)
+            img.save(output, 'WEBP', quality=webp_quality, method=6)
+        registry.by_optimised[entry['optimised']] = entry
+
+        before = os.path.getsize(entry['file']) / 1024
+        after = os.path.getsize(output) / 1024
+        print(f'🖼️  {path}: {before:.1f} KB -> {after:.1f} KB')
+        written += 1
+
+    # Variants of deleted or renamed logos
+    removed = 0
+    out_root = os.path.join(registry.public_dir, 'sponsors', OPTIMISED_DIR)
+    for dir_path, _, file_names in os.walk(out_root, topdown=False):
+        for file_name in file_names:
+            file_path = os.path.normpath(os.path.join(dir_path, file_name))
+            if file_path not in outputs:
+                os.remove(file_path)
+                print(f'🗑️  Removed stale {os.path.relpath(file_path, registry.public_dir)}')
+                removed += 1
+        if not os.listdir(dir_path):
+            os.rmdir(dir_path)
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(new_manifest, f, indent=2)
+
+    return written, skipped, removed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Index sponsor logos and optionally build optimised variants.')
+    parser.add_argument('--public-dir', default=PUBLIC_DIR, help='Path to the public/ folder')
+    parser.add_argument('--optimise', action='store_true', help='Write optimised WebP logo variants')
+    parser.add_argument('--max-width', type=int, default=400, help='Maximum logo width in pixels')
+    parser.add_argument('--max-height', type=int, default=200, help='Maximum logo height in pixels')
+    parser.add_argument('--webp-quality', type=int, default=85, help='WebP quality (0-100)')
+    parser.add_argument('--manifest', default=MANIFEST_PATH, help='Where to keep the content-hash manifest')
+    args = parser.parse_args()
+
+    registry = SponsorRegistry(args.public_dir)
+    print(f'📇 Indexed {len(registry)} sponsor logo(s)')
+    for entries in registry.by_name.values():
+        for entry in entries.values():
+            print(f'   • [{entry["status"]:<7}] {entry["path"]}')
+
+    if args.optimise:
+        written, skipped, removed = optimise_logos(
+            registry, args.max_width, args.max_height, args.webp_quality, args.manifest)
+        print(f'\n✅ Optimised {written} logo(s), {skipped} unchanged, {removed} stale variant(s) removed')
+        print('💡 Re-run convertOpportunitiesExcelToJson.py so sponsorLogo points at the new variants')
@@ -0,0 +1,105 @@
+"""
+Tests for the incremental per-year build in scripts/buildEventsStats.py.
+
+Run:
+  python3 -m unittest discover tests
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+import buildEventsStats  # noqa: E402
+
+EVENTS = [
+    {'id': 'event_001', 'date': '2024-03-01', 'type': 'academic', 'venue': 'Lab 3B',
+     'collaborators': ['SUDATA', 'SUMS'], 'attendees': 30},
+    {'id': 'event_002', 'date': '2024-09-12', 'type': 'social', 'venue': 'TBA',
+     'collaborators': ['SUDATA'], 'attendees': 50},
+    {'id': 'event_003', 'date': '2025-02-20', 'type': 'industry', 'venue': 'The Refectory',
+     'collaborators': ['SUDATA', 'SUMS', 'SYNCS'], 'attendees': 80},
+    {'id': 'event_004', 'date': '2025-08-05', 'type': 'academic', 'venue': 'Lab 3B',
+     'collaborators': ['SUDATA', 'SYNCS'], 'attendees': 25},
+]
+
+
+class BuildEventsStatsTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.events_path = os.path.join(tmp.name, 'events.json')
+        self.output_path = os.path.join(tmp.name, 'events_stats.json')
+        self.write_events(EVENTS)
+
+    def write_events(self, events):
+        with open(self.events_path, 'w', encoding='utf-8') as f:
+            json.dump({'events': events}, f)
+
+    def build(self):
+        """Run a build; returns (years re-aggregated, whether the output file was written)."""
+        if os.path.exists(self.output_path):
+            os.utime(self.output_path, (0, 0))  # any write moves the mtime off 0
+        with mock.patch.object(buildEventsStats, 'rollup_year', wraps=buildEventsStats.rollup_year) as rollup, \
+                contextlib.redirect_stdout(io.StringIO()):
+            buildEventsStats.build_events_stats(self.events_path, self.output_path)
+        years = sorted(buildEventsStats.event_year(call.args[0][0]) for call in rollup.call_args_list)
+        return years, os.path.getmtime(self.output_path) != 0
+
+    def read_stats(self):
+        with open(self.output_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def test_only_the_edited_year_is_rebuilt(self):
+        self.assertEqual(self.build(), (['2024', '2025'], True))
+        self.assertEqual(self.build(), ([], False))
+
+        edited = [dict(e, attendees=100) if e['id'] == 'event_003' else e for e in EVENTS]
+        self.write_events(edited)
+        self.assertEqual(self.build(), (['2025'], True))
+
+        stats = self.read_stats()
+        self.assertEqual(stats['totals'], {'events': 4, 'attendees': 205})
+        self.assertEqual(stats['byYear']['2024']['attendees'], 80)
+        self.assertEqual(stats['byYear']['2025']['attendees'], 125)
+
+    def test_incremental_build_matches_a_full_build(self):
+        self.build()
+        self.write_events(EVENTS[:3] + [dict(EVENTS[3], venue='PNR Learning Studio')])
+        self.build()
+        incremental = self.read_stats()
+
+        os.remove(self.output_path)
+        self.build()
+        self.assertEqual(incremental, self.read_stats())
+
+    def test_removed_year_is_dropped(self):
+        self.build()
+        self.write_events(EVENTS[2:])
+        self.assertEqual(self.build(), ([], True))
+        self.assertEqual(list(self.read_stats()['byYear']), ['2025'])
+
+    def test_merge_settings_change_rewrites_output_without_rebuilding_years(self):
+        self.build()
+        self.assertEqual([c['name'] for c in self.read_stats()['topCollaborators']], ['SUMS', 'SYNCS'])
+
+        with mock.patch.object(buildEventsStats, 'TOP_COLLABORATORS', 1):
+            self.assertEqual(self.build(), ([], True))
+        self.assertEqual([c['name'] for c in self.read_stats()['topCollaborators']], ['SUMS'])
+
+    def test_stale_output_is_rewritten(self):
+        self.build()
+        with open(self.output_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 0}, f)
+        self.assertEqual(self.build(), ([], True))
+        self.assertEqual(self.read_stats()['totals'], {'events': 4, 'attendees': 185})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Tests for the query API in scripts/buildSearchIndex.py.
+
+Run:
+  python3 -m unittest discover tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from buildSearchIndex import SearchIndex, build_index, tokenise_records  # noqa: E402
+
+RECORDS = [
+    ('event_001', 'Python Workshop\nLearn Python basics for data analysis\nComputer Lab 3B\nSUDATA'),
+    ('event_002', 'Datathon\nA weekend data competition\nPNR Learning Studio\nSUDATA\nJane Street'),
+    ('event_003', 'Industry Night\nMeet recruiters from industry\nThe Refectory\nSUDATA\nSUMS'),
+    ('opp_001', 'Internship Program\nSummer internship in data analytics\nJane Street'),
+]
+
+
+def make_index(records=RECORDS):
+    doc_fingerprints, tokens, _ = tokenise_records(records)
+    return SearchIndex(build_index(doc_fingerprints, tokens))
+
+
+class SearchIndexTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.index = make_index()
+
+    def search(self, query, **kwargs):
+        return self.index.search(query, prefix_last=kwargs.pop('prefix_last', False), **kwargs)
+
+    def test_exact_match(self):
+        self.assertEqual(self.search('python'), ['event_001'])
+        self.assertEqual(self.search('jane street'), ['event_002', 'opp_001'])
+
+    def test_all_words_must_match(self):
+        self.assertEqual(self.search('data python'), ['event_001'])
+        self.assertEqual(self.search('python datathon'), [])
+
+    def test_case_accents_and_stopwords_are_ignored(self):
+        self.assertEqual(self.search('PYTHÖN for the data'), ['event_001'])
+
+    def test_last_word_is_prefix_matched(self):
+        self.assertEqual(self.index.search('pyt'), ['event_001'])
+        self.assertEqual(self.index.search('data ana'), ['event_001', 'opp_001'])
+        self.assertEqual(self.index.search('intern'), ['opp_001'])
+
+    def test_stopword_prefix_still_matches(self):
+        # "in" and "an" are stopwords, but also prefixes of industry/internship/analysis
+        self.assertEqual(self.index.search('in'), ['event_003', 'opp_001'])
+        self.assertEqual(self.index.search('data an'), ['event_001', 'opp_001'])
+
+    def test_typo_matches_similar_term(self):
+        self.assertEqual(self.search('wrkshop'), ['event_001'])
+        self.assertEqual(self.search('jane stret'), ['event_002', 'opp_001'])
+
+    def test_typo_does_not_match_unrelated_term(self):
+        # "python" shares "tho"/"hon" with "datathon" but is not a typo of it
+        index = make_index([r for r in RECORDS if r[0] != 'event_001'])
+        self.assertEqual(index.search('python', prefix_last=False), [])
+
+    def test_no_match(self):
+        self.assertEqual(self.search('blockchain'), [])
+        self.assertEqual(self.index.search('zzz'), [])
+        self.assertEqual(self.search(''), [])
+        self.assertEqual(self.search('the of'), [])
+
+    def test_limit(self):
+        self.assertEqual(self.search('sudata', limit=2), ['event_001', 'event_002'])
+
+
+class TokeniseRecordsTest(unittest.TestCase):
+
+    def test_unchanged_records_reuse_cached_tokens_after_ids_shift(self):
+        _, tokens, changed = tokenise_records(RECORDS)
+        self.assertEqual(changed, len(RECORDS))
+
+        shifted = [('event_000', 'Brand new early event')] + [
+            (f'event_{i:03d}', text) for i, (_, text) in enumerate(RECORDS, 1)
+        ]
+        _, _, changed = tokenise_records(shifted, tokens)
+        self.assertEqual(changed, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+"""
+Tests for scripts/checkLinks.py against a local stub HTTP server.
+
+Run:
+  python3 -m unittest discover tests
+"""
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+import checkLinks  # noqa: E402
+from checkLinks import LinkChecker, check_links, placeholder_reason  # noqa: E402
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    /ok        200 for HEAD and GET
+    /no-head   405 for HEAD, 200 for GET
+    /gone      404 for HEAD and GET
+    /slow      sleeps 2s before answering
+    /wait/<n>  sleeps 0.4s before answering
+    /rate/<n>  sleeps 0.2s; start/end times are recorded in `spans`
+    """
+    hits = []
+    spans = []
+
+    def _respond(self):
+        StubHandler.hits.append((self.command, self.path))
+        started = time.monotonic()
+        if self.path == '/slow':
+            time.sleep(2)
+        elif self.path.startswith('/wait'):
+            time.sleep(0.4)
+        elif self.path.startswith('/rate'):
+            time.sleep(0.2)
+            StubHandler.spans.append((started, time.monotonic()))
+
+        if self.path == '/gone' or (self.path == '/no-head' and self.command == 'HEAD'):
+            status = 404 if self.path == '/gone' else 405
+        else:
+            status = 200
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    do_HEAD = _respond
+    do_GET = _respond
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 512  # accept hundreds of simultaneous connections
+
+
+class CheckLinksTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StubServer(('127.0.0.1', 0), StubHandler)
+        cls.base = f'http://127.0.0.1:{cls.server.server_address[1]}'
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        StubHandler.hits = []
+        StubHandler.spans = []
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp.name, 'cache.json')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write_events(self, links):
+        path = os.path.join(self.tmp.name, 'events.json')
+        events = [{'id': f'event_{i:03d}', 'title': f'Event {i}', 'signupLink': url}
+                  for i, url in enumerate(links, 1)]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'events': events}, f)
+        return path
+
+    def run_check(self, links, checker=None, ttl_hours=24.0):
+        checker = checker or LinkChecker(host_interval=0, timeout=1.0)
+        with redirect_stdout(io.StringIO()):
+            problems = check_links([self.write_events(links)], ttl_hours=ttl_hours,
+                                   checker=checker, cache_path=self.cache_path)
+        return {p['url']: p['reason'] for p in problems}
+
+    def test_placeholder_links_are_flagged_without_requests(self):
+        self.assertEqual(placeholder_reason('https://forms.google.com/example'), 'converter default placeholder')
+        self.assertEqual(placeholder_reason(''), 'missing link')
+        self.assertEqual(placeholder_reason('forms.google.com/abc'), 'not an http(s) URL')
+        self.assertIsNone(placeholder_reason('https://www.janestreet.com/apply-portal-aus/'))
+
+        problems = self.run_check(['https://forms.google.com/example', ''])
+        self.assertEqual(set(problems), {'https://forms.google.com/example', ''})
+        self.assertEqual(StubHandler.hits, [])
+
+    def test_head_rejected_falls_back_to_get(self):
+        problems = self.run_check([f'{self.base}/ok', f'{self.base}/no-head', f'{self.base}/gone'])
+        self.assertEqual(problems, {f'{self.base}/gone': 'HTTP 404'})
+        self.assertIn(('GET', '/no-head'), StubHandler.hits)
+        self.assertNotIn(('GET', '/ok'), StubHandler.hits)
+
+    def test_cached_results_are_reused_within_ttl(self):
+        links = [f'{self.base}/ok', f'{self.base}/gone']
+        self.run_check(links)
+        StubHandler.hits = []
+
+        problems = self.run_check(links)
+        self.assertEqual(set(problems), {f'{self.base}/gone'})
+        # Working link comes from the cache, broken link is rechecked
+        self.assertNotIn(('HEAD', '/ok'), StubHandler.hits)
+        self.assertIn(('HEAD', '/gone'), StubHandler.hits)
+
+        StubHandler.hits = []
+        self.run_check(links, ttl_hours=0)
+        self.assertIn(('HEAD', '/ok'), StubHandler.hits)
+
+    def test_slow_link_times_out(self):
+        checker = LinkChecker(host_interval=0, timeout=0.5)
+        problems = self.run_check([f'{self.base}/slow'], checker=checker)
+        self.assertEqual(problems, {f'{self.base}/slow': 'timed out'})
+
+    def test_queued_requests_do_not_count_against_timeout(self):
+        # More connections than asyncio's default executor has threads (at most 32):
+        # none of these is slow, so none may time out while waiting for a thread
+        links = [f'{self.base}/wait/{i}' for i in range(250)]
+        checker = LinkChecker(max_connections=250, per_host=250, host_interval=0, timeout=0.8)
+        self.assertEqual(self.run_check(links, checker=checker), {})
+
+    def test_per_host_concurrency_and_spacing(self):
+        links = [f'{self.base}/rate/{i}' for i in range(8)]
+        checker = LinkChecker(max_connections=8, per_host=2, host_interval=0.1, timeout=2.0)
+        self.assertEqual(self.run_check(links, checker=checker), {})
+
+        spans = sorted(StubHandler.spans)
+        self.assertEqual(len(spans), 8)
+        starts = [start for start, _ in spans]
+        # Request starts to one host are at least host_interval apart (small clock slack)
+        for earlier, later in zip(starts, starts[1:]):
+            self.assertGreaterEqual(later - earlier, 0.09)
+        # Never more than per_host requests to the host at once
+        for start, _ in spans:
+            in_flight = sum(1 for s, e in spans if s <= start < e)
+            self.assertLessEqual(in_flight, 2)
+
+    def test_hung_request_is_cut_off_at_the_deadline(self):
+        # Stands in for a hang urlopen's socket timeout can't see, e.g. DNS resolution
+        def hung_fetch(url, timeout):
+            time.sleep(2)
+            return 200, None
+
+        checker = LinkChecker(host_interval=0, timeout=0.3)
+        start = time.monotonic()
+        with mock.patch.object(checkLinks, 'fetch_status', hung_fetch):
+            problems = self.run_check([f'{self.base}/ok'], checker=checker)
+        self.assertEqual(problems, {f'{self.base}/ok': 'timed out'})
+        self.assertLess(time.monotonic() - start, 1.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
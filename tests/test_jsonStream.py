@@ -0,0 +1,64 @@
+"""
+Tests that scripts/jsonStream.py writes exactly what json.dump would.
+
+Run:
+  python3 -m unittest discover tests
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from jsonStream import sorted_order, write_records_json  # noqa: E402
+
+EVENTS = [
+    {'title': 'Python Workshop', 'attendees': 40, 'collaborators': ['SUDATA'], 'signupLink': None},
+    {'title': 'Café Night — 数据 🎉', 'attendees': 0, 'collaborators': [], 'signupLink': 'https://forms.gle/x'},
+    {'title': 'Nested', 'attendees': 3.5, 'collaborators': [['SUDATA', 'SUMS'], []],
+     'extra': {'tags': ['a', None], 'ok': True, 'empty': {}}},
+]
+
+
+class WriteRecordsJsonTest(unittest.TestCase):
+
+    def assert_matches_json_dump(self, records):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'out.json')
+            count = write_records_json(path, 'events', records, lambda idx, record: dict(record, id=idx))
+            with open(path, 'r', encoding='utf-8') as f:
+                streamed = f.read()
+
+        expected = json.dumps({'events': [dict(r, id=i) for i, r in enumerate(records, 1)]},
+                              indent=2, ensure_ascii=False)
+        self.assertEqual(count, len(records))
+        self.assertEqual(streamed, expected)
+
+    def test_zero_records(self):
+        self.assert_matches_json_dump([])
+
+    def test_one_record(self):
+        self.assert_matches_json_dump(EVENTS[:1])
+
+    def test_non_ascii_text(self):
+        self.assert_matches_json_dump(EVENTS[1:2])
+
+    def test_nested_lists_dicts_and_none(self):
+        self.assert_matches_json_dump(EVENTS[2:])
+
+    def test_several_records(self):
+        self.assert_matches_json_dump(EVENTS)
+
+
+class SortedOrderTest(unittest.TestCase):
+
+    def test_matches_sorting_the_records(self):
+        keys = [('2025-03-01', '18:00'), ('2024-12-01', '09:00'), ('2025-03-01', '10:00'), ('2024-12-01', '09:00')]
+        self.assertEqual([keys[i] for i in sorted_order(keys)], sorted(keys))
+        self.assertEqual(sorted_order(keys), [1, 3, 2, 0])  # stable, like list.sort
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Tests for sponsor logo validation in scripts/sponsorRegistry.py, run against
+the logos and sponsor lists in this repo, and for the optimised logo variants
+(needs Pillow), run against a temporary public/ folder.
+
+Run:
+  python3 -m unittest discover tests
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from sponsorRegistry import SponsorRegistry, optimise_logos  # noqa: E402
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+class ValidateLogoTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.registry = SponsorRegistry()
+
+    def test_current_sponsor_with_its_logo_is_ok(self):
+        self.assertEqual(
+            self.registry.validate_logo('IMC Trading', '/sponsors/current-sponsors/imc-trading.webp'),
+            ('/sponsors/current-sponsors/imc-trading.webp', []),
+        )
+
+    def test_blank_logo_is_auto_filled(self):
+        self.assertEqual(self.registry.validate_logo('Jane Street', ''),
+                         ('/sponsors/current-sponsors/jane-street.png', []))
+
+    def test_display_names_match_logos_with_different_file_names(self):
+        for name, path in (
+            ('Heidi Health', '/sponsors/past-partners/heidi.png'),
+            ('Woolworths Group', '/sponsors/past-partners/woolworths.png'),
+            ('Aptent Digital', '/sponsors/past-partners/aptent.png'),
+            ('Rhombus AI', '/sponsors/past-partners/rhombus.png'),
+            ('NSW Ministry of Health', '/sponsors/past-partners/nsw-health.png'),
+            ('CBA', '/sponsors/past-partners/cba.png'),
+            ('Commonwealth Bank', '/sponsors/past-partners/cba.png'),
+        ):
+            with self.subTest(name=name):
+                logo, warnings = self.registry.validate_logo(name, '')
+                self.assertEqual(logo, path)
+                logo, warnings = self.registry.validate_logo(name, path)
+                self.assertEqual(warnings, [f'sponsor "{name}" is not a current sponsor (a past partner)'])
+
+    def test_other_sponsors_logo_is_reported(self):
+        _, warnings = self.registry.validate_logo('Westpac', '/sponsors/current-sponsors/atlassian.png')
+        self.assertEqual(warnings, ['logo "/sponsors/current-sponsors/atlassian.png" does not match sponsor "Westpac"'])
+
+    def test_past_partner_with_other_sponsors_logo_reports_both(self):
+        _, warnings = self.registry.validate_logo('Canva', '/sponsors/current-sponsors/atlassian.png')
+        self.assertEqual(warnings, [
+            'sponsor "Canva" is not a current sponsor (a past partner)',
+            'logo "/sponsors/current-sponsors/atlassian.png" does not match sponsor "Canva"',
+        ])
+
+    def test_missing_logo_file_suggests_the_right_one(self):
+        logo, warnings = self.registry.validate_logo('Westpac', '/sponsors/current-sponsors/westpac.jpg')
+        self.assertEqual(logo, '/sponsors/current-sponsors/westpac.jpg')
+        self.assertEqual(warnings, ['logo "/sponsors/current-sponsors/westpac.jpg" does not exist in public/ '
+                                    '(did you mean /sponsors/current-sponsors/westpac.png?)'])
+
+    def test_unknown_sponsor(self):
+        self.assertEqual(self.registry.validate_logo('Initech', ''), ('', [
+            'sponsor "Initech" is not a current sponsor (not in public/sponsors/)',
+            'no logo found for sponsor "Initech"',
+        ]))
+
+
+@unittest.skipIf(Image is None, 'needs Pillow')
+class OptimiseLogosTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.public_dir = os.path.join(tmp.name, 'public')
+        self.manifest = os.path.join(tmp.name, 'manifest.json')
+        self.logos = os.path.join(self.public_dir, 'sponsors', 'current-sponsors')
+        os.makedirs(self.logos)
+        Image.new('RGB', (800, 200), 'red').save(os.path.join(self.logos, 'acme.png'))
+        Image.new('RGB', (100, 100), 'blue').save(os.path.join(self.logos, 'acme.webp'))
+        with open(os.path.join(self.logos, 'vector.svg'), 'w') as f:
+            f.write('<svg xmlns="http://www.w3.org/2000/svg"/>')
+
+    def optimise(self):
+        registry = SponsorRegistry(self.public_dir, name_sources=[], aliases={})
+        with contextlib.redirect_stdout(io.StringIO()):
+            return registry, optimise_logos(registry, manifest_path=self.manifest)
+
+    def variants(self):
+        out_dir = os.path.join(self.public_dir, 'sponsors', 'optimised', 'current-sponsors')
+        return sorted(os.listdir(out_dir)) if os.path.isdir(out_dir) else []
+
+    def test_variants_are_named_after_the_full_file_name(self):
+        _, counts = self.optimise()
+        self.assertEqual(counts, (2, 0, 0))
+        self.assertEqual(self.variants(), ['acme.png.webp', 'acme.webp.webp'])
+        out_dir = os.path.join(self.public_dir, 'sponsors', 'optimised', 'current-sponsors')
+        with Image.open(os.path.join(out_dir, 'acme.png.webp')) as img:
+            self.assertEqual(img.size, (400, 100))
+        with Image.open(os.path.join(out_dir, 'acme.webp.webp')) as img:
+            self.assertEqual(img.size, (100, 100))
+
+    def test_unchanged_logos_are_skipped(self):
+        self.optimise()
+        Image.new('RGB', (800, 200), 'green').save(os.path.join(self.logos, 'acme.png'))
+        _, counts = self.optimise()
+        self.assertEqual(counts, (1, 1, 0))
+
+    def test_variants_of_deleted_logos_are_removed(self):
+        self.optimise()
+        os.remove(os.path.join(self.logos, 'acme.webp'))
+        _, counts = self.optimise()
+        self.assertEqual(counts, (0, 1, 1))
+        self.assertEqual(self.variants(), ['acme.png.webp'])
+
+        os.remove(os.path.join(self.logos, 'acme.png'))
+        self.assertEqual(self.optimise()[1], (0, 0, 1))
+        self.assertFalse(os.path.exists(os.path.join(self.public_dir, 'sponsors', 'optimised')))
+
+    def test_sponsor_logo_points_at_the_variant(self):
+        registry = SponsorRegistry(self.public_dir, name_sources=[], aliases={})
+        self.assertEqual(registry.optimised_logo('/sponsors/current-sponsors/acme.png'),
+                         '/sponsors/current-sponsors/acme.png')
+
+        registry, _ = self.optimise()
+        variant = '/sponsors/optimised/current-sponsors/acme.png.webp'
+        self.assertEqual(registry.optimised_logo('/sponsors/current-sponsors/acme.png'), variant)
+        self.assertEqual(registry.optimised_logo('/sponsors/current-sponsors/vector.svg'),
+                         '/sponsors/current-sponsors/vector.svg')
+
+        # A variant path in the spreadsheet is checked as the logo it was built from
+        registry = SponsorRegistry(self.public_dir, name_sources=[], aliases={})
+        self.assertEqual(registry.validate_logo('Acme', registry.lookup('Acme')['optimised']),
+                         ('/sponsors/optimised/current-sponsors/acme.webp.webp', []))
+        self.assertEqual(registry.validate_logo('Vector', variant),
+                         (variant, [f'logo "{variant}" does not match sponsor "Vector"']))
+
+
+if __name__ == '__main__':
+    unittest.main()